@@ -1,15 +1,20 @@
 
 import os
 import json
-import base64
+import hashlib
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+import orjson
 import uvicorn
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from typing import List, Dict, Any
-import shutil # For file operations
-import tempfile # For secure temporary file handling
+import io
 
 # Load environment variables from .env file
 load_dotenv()
@@ -26,20 +31,46 @@ try:
 except Exception:
     # Fall back to the local placeholder if the real scraper cannot be imported
     import web_scraper_local as web_scraper
-import google.generativeai as genai
+import itertools
 import traceback
-from google.api_core import exceptions as api_exceptions
+
+# --- Executors ---
+# Endpoints are async, so blocking work must not run on the event loop.
+# PDF parsing and skill extraction are CPU-bound pure Python and go to worker
+# processes; recommendations (NumPy/SciPy) and scraping (network I/O) release
+# the GIL and run in threads.
+PDF_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+IO_EXEC = ThreadPoolExecutor(max_workers=32)
+
+def _reset_pdf_pool(broken: ProcessPoolExecutor) -> None:
+    """
+    Replaces PDF_POOL after a worker died (e.g. OOM or a native crash on a bad PDF);
+    a broken pool rejects every later submission. Only the request that still
+    holds the broken pool swaps it, so concurrent failures recreate it once.
+    """
+    global PDF_POOL
+    if PDF_POOL is broken:
+        PDF_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+        broken.shutdown(wait=False, cancel_futures=True)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    PDF_POOL.shutdown(wait=False, cancel_futures=True)
+    IO_EXEC.shutdown(wait=False, cancel_futures=True)
 
 # --- FastAPI App Initialization ---
 app = FastAPI(
     title="Job Recommendation Backend API",
     description="API for processing resumes, recommending jobs, and providing upskilling suggestions.",
     version="1.0.0",
+    # orjson serializes the large recommendation payloads (and numpy scalars) in C
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Allow CORS from the frontend dev server(s) and production
 # Note: FastAPI CORS doesn't support wildcard subdomains, so we use allow_origin_regex
-import re
 
 allowed_origins = [
     "http://localhost:8080",
@@ -68,8 +99,28 @@ if not GEMINI_API_KEY:
     print("Warning: GEMINI_API_KEY not set. /upskill_suggestions will be unavailable.")
     genai = None
 else:
+    # Imported only when configured: the Google client adds noticeably to cold start.
+    import google.generativeai as genai
+    from google.api_core import exceptions as api_exceptions
     genai.configure(api_key=GEMINI_API_KEY)
 
+REDIS_URL = os.getenv("REDIS_URL")
+RECOMMENDATION_CACHE_TTL = int(os.getenv("RECOMMENDATION_CACHE_TTL", "3600"))
+# Short socket timeouts so an unreachable Redis degrades to a cache miss instead of stalling requests
+REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", "0.5"))
+redis_client = None
+if REDIS_URL:
+    try:
+        import redis
+        redis_client = redis.Redis.from_url(
+            REDIS_URL,
+            socket_timeout=REDIS_TIMEOUT,
+            socket_connect_timeout=REDIS_TIMEOUT,
+        )
+    except Exception as e:
+        print(f"Warning: Redis cache disabled ({e}).")
+        redis_client = None
+
 GEMINI_SYSTEM_PROMPT = (
     "You are an expert at deciding work domain. "
     "Analyze the following prompt given by the user which has a list of skills they know:\n\n"
@@ -81,6 +132,20 @@ GEMINI_SYSTEM_PROMPT = (
     "4. Opportunities\n"
 )
 
+# Built once at startup and reused by every request
+if genai:
+    GEMINI_MODEL = genai.GenerativeModel(
+        model_name="models/gemini-2.0-flash-exp",  # Faster Flash model
+        system_instruction=GEMINI_SYSTEM_PROMPT
+    )
+    GEMINI_GENERATION_CONFIG = genai.types.GenerationConfig(
+        max_output_tokens=800,  # Limit response length for speed
+        temperature=0.7,
+    )
+else:
+    GEMINI_MODEL = None
+    GEMINI_GENERATION_CONFIG = None
+
 # --- Pydantic Models for Request/Response ---
 
 class ProcessResumeResponse(BaseModel):
@@ -97,13 +162,52 @@ class RecommendJobsResponse(BaseModel):
 class UpskillSuggestionsRequest(BaseModel):
     skills: List[str]
 
-class UpskillSuggestionsResponse(BaseModel):
-    suggestions: str
-
 class FetchJobsResponse(BaseModel):
     new_jobs_count: int
     message: str
 
+# --- Recommendation Cache ---
+
+def _data_mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+def _recommendation_cache_key(request: RecommendJobsRequest) -> str:
+    """
+    Recommendations are a pure function of the user profile and the data files,
+    so key on both; a rescrape or vocabulary edit bumps an mtime and misses the cache.
+    """
+    payload = json.dumps([
+        # Same normalization get_recommendations applies, so equivalent inputs share a key
+        sorted(job_recommendor.normalize_user_skills(request.user_skills)),
+        request.user_experience,
+        _data_mtime(job_recommendor.JOB_DATA_PATH),
+        _data_mtime(job_recommendor.SKILL_WEIGHTS_PATH),
+        # The skills vocabulary decides which skills are extracted from each job
+        _data_mtime(skills_extraction.SKILLS_CSV_PATH),
+    ])
+    return "rec:" + hashlib.sha1(payload.encode()).hexdigest()
+
+def _cache_get(key: str):
+    if redis_client is None:
+        return None
+    try:
+        cached = redis_client.get(key)
+        return orjson.loads(cached) if cached is not None else None
+    except Exception as e:
+        print(f"Warning: Redis GET failed: {e}")
+        return None
+
+def _cache_set(key: str, value) -> None:
+    if redis_client is None:
+        return
+    try:
+        redis_client.setex(key, RECOMMENDATION_CACHE_TTL, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+    except Exception as e:
+        print(f"Warning: Redis SETEX failed: {e}")
+
 # --- API Endpoints ---
 
 @app.get("/")
@@ -125,69 +229,96 @@ async def process_resume_endpoint(file: UploadFile = File(...)):
     if not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed.")
 
-    # Save the uploaded file temporarily
-    # Use tempfile to create a secure temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-        shutil.copyfileobj(file.file, temp_file)
-        temp_file_path = temp_file.name
+    # Read the upload in chunks without blocking the event loop; the PDF is
+    # parsed straight from memory, so no temporary file is needed.
+    buf = io.BytesIO()
+    while chunk := await file.read(1 << 20):
+        buf.write(chunk)
 
-    try:
-        skills, experience = skills_extraction.process_resume_from_path(temp_file_path)
-        return ProcessResumeResponse(skills=skills, experience=experience)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing resume: {e}")
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
+    loop = asyncio.get_running_loop()
+    # Retry once on a fresh pool: the crash may have come from another request's upload
+    for _ in range(2):
+        pool = PDF_POOL
+        try:
+            skills, experience = await loop.run_in_executor(
+                pool, skills_extraction.process_resume_from_bytes, buf.getvalue()
+            )
+            return ProcessResumeResponse(skills=skills, experience=experience)
+        except BrokenProcessPool:
+            print("Resume worker process died; recreating the PDF pool.")
+            _reset_pdf_pool(pool)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error processing resume: {e}")
+
+    raise HTTPException(status_code=500, detail="Error processing resume: the PDF could not be parsed.")
 
 
 @app.post("/recommend_jobs", response_model=RecommendJobsResponse)
 async def recommend_jobs_endpoint(request: RecommendJobsRequest):
     """
     Generates job recommendations based on user skills and experience.
+    Results are served from Redis when REDIS_URL is configured.
     """
+    # The Redis client is synchronous, so cache calls also go through IO_EXEC
+    loop = asyncio.get_running_loop()
+    cache_key = _recommendation_cache_key(request)
+    cached = await loop.run_in_executor(IO_EXEC, _cache_get, cache_key)
+    if cached is not None:
+        return RecommendJobsResponse(recommendations=cached)
+
     try:
-        recommendations_df = job_recommendor.get_recommendations(
-            user_skills_list=request.user_skills,
-            user_work_experience=request.user_experience
+        recommendations_df = await loop.run_in_executor(
+            IO_EXEC, job_recommendor.get_recommendations, request.user_skills, request.user_experience
         )
         # Convert DataFrame to a list of dictionaries for JSON response
         recommendations_list = recommendations_df.to_dict(orient="records")
+        await loop.run_in_executor(IO_EXEC, _cache_set, cache_key, recommendations_list)
         return RecommendJobsResponse(recommendations=recommendations_list)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {e}")
 
 
-@app.post("/upskill_suggestions", response_model=UpskillSuggestionsResponse)
+@app.post("/upskill_suggestions")
 async def upskill_suggestions_endpoint(request: UpskillSuggestionsRequest):
     """
     Provides AI-powered upskilling suggestions based on user skills.
-    Uses Gemini Flash (faster model) with optimized prompting.
+    Uses Gemini Flash (faster model) with optimized prompting and streams
+    the generated text back as plain text chunks.
     """
-    if not genai:
+    if GEMINI_MODEL is None:
         raise HTTPException(status_code=503, detail="AI service not configured. Set GEMINI_API_KEY environment variable.")
-    
-    # Use Flash model for faster responses
-    model = genai.GenerativeModel(
-        model_name="models/gemini-2.0-flash-exp",  # Faster Flash model
-        system_instruction=GEMINI_SYSTEM_PROMPT
-    )
 
     # Optimized prompt for faster response
     user_prompt = f"Skills: {', '.join(request.skills[:10])}"  # Limit to 10 skills for speed
     
     try:
-        # Use non-streaming for simpler response
-        response = model.generate_content(
-            user_prompt,
-            generation_config=genai.types.GenerationConfig(
-                max_output_tokens=800,  # Limit response length for speed
-                temperature=0.7,
+        # Stream the response so the client sees text as soon as Gemini produces it
+        def start_stream():
+            response = GEMINI_MODEL.generate_content(
+                user_prompt,
+                generation_config=GEMINI_GENERATION_CONFIG,
+                stream=True,
             )
-        )
-        suggestions = response.text
-        return UpskillSuggestionsResponse(suggestions=suggestions)
+            chunks = iter(response)
+            # Pull the first chunk here so API errors are still mapped to HTTP errors below
+            return chunks, next(chunks, None)
+
+        # Both calls block on the network, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        chunks, first_chunk = await loop.run_in_executor(IO_EXEC, start_stream)
+
+        def stream_suggestions():
+            if first_chunk is None:
+                return
+            try:
+                for chunk in itertools.chain([first_chunk], chunks):
+                    if chunk.parts:
+                        yield chunk.text
+            except Exception:
+                # Headers are already sent; all we can do is log and end the stream
+                print("Gemini streaming error (traceback):", traceback.format_exc())
+
+        return StreamingResponse(stream_suggestions(), media_type="text/plain; charset=utf-8")
     except Exception as e:
         # Log full traceback for debugging
         tb = traceback.format_exc()
@@ -347,7 +478,10 @@ async def fetch_new_jobs_endpoint():
     This replaces the entire job list with fresh data from the website.
     """
     try:
-        total_jobs_count = web_scraper.fetch_and_update_jobs()
+        loop = asyncio.get_running_loop()
+        total_jobs_count = await loop.run_in_executor(IO_EXEC, web_scraper.fetch_and_update_jobs)
+        # Rebuild the cached job index on the next recommendation request
+        job_recommendor.invalidate_cache()
         message = f"Job database refreshed. Total jobs in database: {total_jobs_count}"
         
         return FetchJobsResponse(
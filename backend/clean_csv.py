@@ -1,11 +1,19 @@
 import csv
-import re
 import os
+import string
 
 # --- Constants ---
 INPUT_FILE = os.path.join('data', 'tech_skills.csv')
 OUTPUT_FILE = os.path.join('data', 'tech_skills_clean.csv')
 
+# Every ASCII byte except a-z and 0-9, deleted in one bytes.translate pass
+_KEEP = (string.ascii_lowercase + string.digits).encode()
+_DELETE = bytes(b for b in range(128) if b not in _KEEP)
+
+def _clean_skill(cell: str) -> str:
+    """Lowercases a skill and keeps only [a-z0-9]; non-ASCII chars are dropped by the encode."""
+    return cell.lower().encode('ascii', 'ignore').translate(None, _DELETE).decode()
+
 def clean_skills_csv(input_path: str, output_path: str):
     """
     Reads a single row of skills from a CSV, cleans each skill,
@@ -22,7 +30,7 @@ def clean_skills_csv(input_path: str, output_path: str):
                 return
 
             # Clean each cell in the row: convert to lowercase and remove non-alphanumeric chars.
-            cleaned_row = [re.sub(r'[^a-z0-9]', '', cell.lower()) for cell in first_row]
+            cleaned_row = [_clean_skill(cell) for cell in first_row]
 
         # Save the cleaned row to a new CSV file
         with open(output_path, "w", newline="", encoding='utf-8') as outfile:
@@ -1,39 +1,51 @@
 import re
 import json
 import os
-from ftfy import fix_text
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import threading
+import functools
+from dataclasses import dataclass
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.metrics.pairwise import linear_kernel
+import numpy as np
 import pandas as pd
-from typing import List, Set
+from typing import Dict, FrozenSet, List, Optional, Set
 import skills_extraction
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; scoring falls back to sparse NumPy/SciPy operations
+    njit = None
+
 # --- Constants ---
 CONFIDENCE_WEIGHT = 0.7
 EXPERIENCE_WEIGHT = 0.03
+MAX_RECOMMENDATIONS = 25
 SKILL_WEIGHTS_PATH = os.path.join(os.path.dirname(__file__), 'skill_weights.json')
 JOB_DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'job_data.csv')
 RECOMMENDATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'job_recommendations.csv')
 
-# --- Helper Functions ---
+# Columns read from job_data.csv: those used for scoring and link normalization,
+# plus the display fields the frontend maps from each recommendation.
+JOB_DATA_COLUMNS = [
+    'Title', 'Company Name', 'Company', 'Description', 'Processed Job Description',
+    'Location', 'Job Type', 'Salary', 'Required Experience',
+    'Link', 'Company Apply Url', 'Detail URL',
+]
 
-def ngrams(string: str, n: int = 3) -> list[str]:
-    """Preprocesses text and creates n-grams."""
-    string = fix_text(string)
-    string = string.encode("ascii", errors="ignore").decode()
-    string = string.lower()
-    chars_to_remove = [")", "(", ".", "|", "[", "]", "{", "}", "'"]
-    rx = '[' + re.escape(''.join(chars_to_remove)) + ']'
-    string = re.sub(rx, '', string)
-    string = string.replace('&', 'and')
-    string = string.replace(',', ' ')
-    string = string.replace('-', ' ')
-    string = string.title()
-    string = re.sub(' +', ' ', string).strip()
-    string = ' ' + string + ' '
-    string = re.sub(r'[,-./]|\sBD', r'', string)
-    ngrams = zip(*[string[i:] for i in range(n)])
-    return [''.join(ngram) for ngram in ngrams]
+# Job and user skills are already space-joined bags of skill tokens, so hash the
+# whitespace-separated tokens directly. Stateless: nothing to fit, and rows come
+# out L2-normalized.
+VECTORIZER = HashingVectorizer(
+    analyzer='word',
+    token_pattern=r'(?u)\S+',
+    norm='l2',
+    alternate_sign=False,
+    n_features=2**18,
+)
+
+# --- Helper Functions ---
 
 def extract_skilling(jd: str) -> str:
     """Extracts and cleans skills from a job description."""
@@ -48,144 +60,289 @@ def extract_skilling(jd: str) -> str:
     # So, this function will be removed from here.
     pass # This function will be removed from here.
 
-def calculate_experience_score(required_experience: float, user_experience: int) -> int:
-    """Calculates the experience score."""
-    return 1 if user_experience >= required_experience else 0
+def normalize_user_skills(user_skills_list: List[str]) -> Set[str]:
+    """
+    Normalizes user skills to Title case to match the title-cased job skills
+    produced by skills_extraction. Deduplicated so repeated skills don't
+    inflate their term weight in the user vector.
+    """
+    return {s.strip().title() for s in user_skills_list if s.strip()}
 
-def find_strengths(job_skills: str, user_skills: Set[str]) -> str:
+def find_strengths(job_skills_set: FrozenSet[str], user_skills: Set[str]) -> str:
     """Finds matching skills between the job and the user."""
-    job_skills_set = set(job_skills.split())
     strengths = job_skills_set & user_skills
     return ' '.join(list(strengths)[:5])
 
-def find_weaknesses(job_title: str, user_skills: Set[str], job_skill_weights: dict) -> str:
+@dataclass
+class _RoleTable:
+    """Role lookup derived from skill_weights.json."""
+    pattern: re.Pattern
+    roles: Dict[str, str]              # lowercased role key -> role key
+    skills: Dict[str, FrozenSet[str]]  # role -> required skills
+    ranked: Dict[str, List[str]]       # role -> skills by descending weight
+
+def _build_role_table(job_skill_weights: dict) -> _RoleTable:
+    """Compiles the role keys into one longest-first alternation and pre-ranks each role's skills."""
+    keys = sorted(job_skill_weights.keys(), key=len, reverse=True)
+    pattern = re.compile('|'.join(re.escape(k.lower()) for k in keys) or r'(?!)')
+    return _RoleTable(
+        pattern=pattern,
+        roles={k.lower(): k for k in keys},
+        skills={k: frozenset(w) for k, w in job_skill_weights.items()},
+        ranked={k: [s for _, s in sorted(((wt, s) for s, wt in w.items()), reverse=True)]
+                for k, w in job_skill_weights.items()},
+    )
+
+@functools.lru_cache(maxsize=1)
+def _load_role_table(mtime: float) -> _RoleTable:
+    """Parses skill_weights.json; cached per file mtime so edits are picked up."""
+    with open(SKILL_WEIGHTS_PATH, 'r') as f:
+        return _build_role_table(json.load(f))
+
+def _get_role_table() -> Optional[_RoleTable]:
+    """Returns the role table for the current skill_weights.json."""
+    try:
+        mtime = os.path.getmtime(SKILL_WEIGHTS_PATH)
+    except FileNotFoundError:
+        print(f"Error: {SKILL_WEIGHTS_PATH} not found.")
+        return None
+    return _load_role_table(mtime)
+
+def find_weaknesses(job_title: str, user_skills: Set[str], role_table: _RoleTable) -> str:
     """Finds skills the user is lacking for a specific job title."""
-    job_keys = list(job_skill_weights.keys())
-    job_role = 'Engineer'  # Default role
-    for key in job_keys:
-        if key.lower() in job_title.lower():
-            job_role = key
-            break
-    
-    skills_required = set(job_skill_weights.get(job_role, {}).keys())
-    skills_lacking = skills_required - user_skills
-    
-    # Sort lacking skills by their weight (importance)
-    lacking_with_weights = [(job_skill_weights[job_role].get(skill, 0), skill) for skill in skills_lacking]
-    weakness = sorted(lacking_with_weights, reverse=True)[:3]
-    
-    return ' '.join(i[1] for i in weakness)
+    m = role_table.pattern.search(str(job_title).lower())
+    job_role = role_table.roles[m.group(0)] if m else 'Engineer'  # Default role
 
-# --- Main Recommendation Logic ---
+    skills_lacking = role_table.skills.get(job_role, frozenset()) - user_skills
 
-def get_recommendations(user_skills_list: List[str], user_work_experience: int) -> pd.DataFrame:
+    # Skills are pre-ranked by their weight (importance)
+    weakness = [s for s in role_table.ranked.get(job_role, []) if s in skills_lacking][:3]
+
+    return ' '.join(weakness)
+
+# --- Scoring Kernel ---
+
+def _score_jobs_merge_join(user_indices, user_data, jd_indptr, jd_indices, jd_data,
+                       required_exp, user_exp, confidence_weight, experience_weight):
     """
-    Loads data, processes user profile, and generates job recommendations.
+    Single-threaded pass computing the sparse cosine and combined score for each
+    job, merge-joining sorted feature indices (rows need sorted indices).
     """
-    # --- 1. Load Data and Config ---
+    n_jobs = jd_indptr.shape[0] - 1
+    n_user = user_indices.shape[0]
+    sims = np.empty(n_jobs, dtype=np.float32)
+    combined = np.empty(n_jobs, dtype=np.float32)
+    for i in range(n_jobs):
+        # Merge-join the user's and the job's sorted feature indices
+        dot = 0.0
+        a = 0
+        b = jd_indptr[i]
+        end = jd_indptr[i + 1]
+        while a < n_user and b < end:
+            if user_indices[a] == jd_indices[b]:
+                dot += user_data[a] * jd_data[b]
+                a += 1
+                b += 1
+            elif user_indices[a] < jd_indices[b]:
+                a += 1
+            else:
+                b += 1
+        exp_score = 1.0 if required_exp[i] <= user_exp else 0.0
+        sims[i] = dot
+        combined[i] = dot * confidence_weight + exp_score * experience_weight
+    return sims, combined
+
+if njit is not None:
+    # No parallel=True: requests already score concurrently from IO_EXEC threads,
+    # and nested parallel regions oversubscribe the CPU (or abort under numba's
+    # workqueue threading layer).
+    _score_jobs_merge_join = njit(cache=True)(_score_jobs_merge_join)
+
+def _score_jobs(user_vec: csr_matrix, idx: '_JobIndex', user_work_experience: int):
+    """Returns (match confidence, combined score) arrays for every job in the index."""
+    if njit is not None:
+        user_vec.sort_indices()
+        jd = idx.jd_tfidf
+        return _score_jobs_merge_join(
+            user_vec.indices, user_vec.data, jd.indptr, jd.indices, jd.data,
+            idx.required_exp, np.float32(user_work_experience),
+            CONFIDENCE_WEIGHT, EXPERIENCE_WEIGHT,
+        )
+
+    # Rows are L2-normalized, so the linear kernel (one sparse matvec) equals
+    # cosine similarity without cosine_similarity's re-normalization pass.
+    # float32 matches the kernel's output dtype.
+    sims = linear_kernel(user_vec, idx.jd_tfidf).ravel().astype(np.float32)
+    exp_score = (idx.required_exp <= user_work_experience).astype(np.float32)
+    return sims, sims * CONFIDENCE_WEIGHT + exp_score * EXPERIENCE_WEIGHT
+
+# --- Job Index Cache ---
+
+@dataclass
+class _JobIndex:
+    """Parsed job data and its skill vectors, rebuilt only when job_data.csv changes."""
+    mtime: float
+    df: pd.DataFrame
+    skills_series: pd.Series
+    skills_sets: List[FrozenSet[str]]
+    jd_tfidf: csr_matrix
+    required_exp: np.ndarray
+
+_job_index: Optional[_JobIndex] = None
+_job_index_lock = threading.Lock()
+
+def invalidate_cache() -> None:
+    """Drops the cached job index so the next request rebuilds it from disk."""
+    global _job_index
+    with _job_index_lock:
+        _job_index = None
+
+def _read_job_data() -> pd.DataFrame:
+    """Reads only JOB_DATA_COLUMNS from job_data.csv, using Arrow's parser when available."""
+    header = pd.read_csv(JOB_DATA_PATH, nrows=0).columns
+    columns = [c for c in JOB_DATA_COLUMNS if c in header]
     try:
-        jd_df = pd.read_csv(JOB_DATA_PATH)
-    except FileNotFoundError:
-        print(f"Error: {JOB_DATA_PATH} not found.")
-        return pd.DataFrame() # Return empty DataFrame on error
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return pd.read_csv(JOB_DATA_PATH, usecols=columns, dtype={'Required Experience': 'float64'})
+
+    column_types = {c: pa.string() for c in columns}
+    if 'Required Experience' in column_types:
+        column_types['Required Experience'] = pa.float64()
+    try:
+        table = pa_csv.read_csv(
+            JOB_DATA_PATH,
+            # Descriptions contain quoted multi-line text
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            # Empty cells become nulls, as with pandas, so the Link fallback chain sees them as missing
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns, column_types=column_types, strings_can_be_null=True,
+            ),
+        )
+    except pa.ArrowInvalid as e:
+        print(f"Arrow CSV parse failed ({e}), falling back to pandas parser.")
+        return pd.read_csv(JOB_DATA_PATH, usecols=columns, dtype={'Required Experience': 'float64'})
+    return table.to_pandas()
+
+def _build_job_index(mtime: float) -> _JobIndex:
+    """Loads job_data.csv, extracts skills per job and vectorizes them."""
+    jd_df = _read_job_data()
 
     # Ensure a usable Link/apply URL column exists. Some datasets use different
     # column names (e.g. 'Link', 'Detail URL', 'Company Apply Url'). Normalize
     # into a single 'Link' column so the API always returns a consistent field.
-    alt_cols = ['Link', 'Company Apply Url', 'Detail URL', 'Detail URL', 'Company']
-    if 'Link' not in jd_df.columns:
-        jd_df['Link'] = ''
-
-    # For each alternative column, if Link is empty for a row, try to fill it
-    # from the alternative column's value.
-    for col in ['Company Apply Url', 'Detail URL', 'Company']:
+    # Empty links are treated as missing and filled column by column with
+    # vectorized fillna rather than a per-row apply.
+    if 'Link' in jd_df.columns:
+        link = jd_df['Link'].astype(object).replace('', pd.NA)
+    else:
+        link = pd.Series(pd.NA, index=jd_df.index, dtype=object)
+    for col in ('Company Apply Url', 'Detail URL', 'Company'):
         if col in jd_df.columns:
-            def choose_link(row):
-                cur = row.get('Link')
-                alt = row.get(col)
-                if cur is None or cur == '' or (isinstance(cur, float) and pd.isna(cur)):
-                    return alt if alt is not None else ''
-                return cur
-            jd_df['Link'] = jd_df.apply(choose_link, axis=1)
+            link = link.fillna(jd_df[col])
+    jd_df['Link'] = link.fillna('').astype(str)
+
+    # One batched extraction pass over all descriptions per CSV refresh
+    descriptions = jd_df['Description'].fillna('').astype(str).tolist()
+    skills_series = pd.Series(
+        [' '.join(sorted(skills)) for skills in skills_extraction._extract_skills_batch(descriptions)],
+        index=jd_df.index,
+    )
+    jd_df['skills'] = skills_series
+    skills_sets = [frozenset(s.split()) for s in skills_series]
 
+    jd_tfidf = VECTORIZER.transform(skills_series.values.astype('U')).tocsr()
+    jd_tfidf.sort_indices()
+    # Missing requirements compare as +inf, i.e. never satisfied.
+    required_exp = jd_df['Required Experience'].to_numpy(dtype=np.float32, na_value=np.inf)
+
+    print(f"Built job index for {len(jd_df)} jobs")
+    return _JobIndex(mtime=mtime, df=jd_df, skills_series=skills_series,
+                     skills_sets=skills_sets, jd_tfidf=jd_tfidf, required_exp=required_exp)
+
+def _get_job_index() -> Optional[_JobIndex]:
+    """Returns the cached job index, rebuilding it if job_data.csv has changed."""
+    global _job_index
     try:
-        with open(SKILL_WEIGHTS_PATH, 'r') as f:
-            job_skill_weights = json.load(f)
+        mtime = os.path.getmtime(JOB_DATA_PATH)
     except FileNotFoundError:
-        print(f"Error: {SKILL_WEIGHTS_PATH} not found.")
+        print(f"Error: {JOB_DATA_PATH} not found.")
+        return None
+
+    with _job_index_lock:
+        if _job_index is None or _job_index.mtime != mtime:
+            _job_index = _build_job_index(mtime)
+        return _job_index
+
+# --- Main Recommendation Logic ---
+
+def get_recommendations(user_skills_list: List[str], user_work_experience: int) -> pd.DataFrame:
+    """
+    Loads data, processes user profile, and generates job recommendations.
+    """
+    # --- 1. Load Data and Config ---
+    idx = _get_job_index()
+    if idx is None:
+        return pd.DataFrame() # Return empty DataFrame on error
+
+    role_table = _get_role_table()
+    if role_table is None:
         return pd.DataFrame() # Return empty DataFrame on error
 
     # --- 2. Process User Profile ---
-    # Normalize user skills to Title case to match the ngrams/title-casing pipeline used
-    # by the `ngrams` function and job skills generation.
-    user_skills_str = ' '.join(user_skills_list).title()
-    user_skills_set = set(s.title() for s in user_skills_list)
+    user_skills_set = normalize_user_skills(user_skills_list)
+    user_skills_str = ' '.join(sorted(user_skills_set))
     
     if user_work_experience == 0:
         user_work_experience = 10  # Default experience if not found
 
-    # --- 3. Process Job Descriptions ---
-    # This part needs to call skills_extraction.extract_skills directly
-    # as extract_skilling is removed.
-    jd_df['skills'] = jd_df['Description'].fillna('').apply(
-        lambda desc: ' '.join(sorted(list(skills_extraction._extract_skills_from_text(str(desc)))))
-    )
+    # --- 3. Score All Jobs ---
+    # Job skill vectors come from the cached index; only the user profile is
+    # vectorized per request. Similarity and the combined score for ALL jobs
+    # (not just those matching experience requirements) come from one pass.
+    skills_tfidf = VECTORIZER.transform([user_skills_str])
+    match, combined = _score_jobs(skills_tfidf, idx, user_work_experience)
 
-    # --- 4. Calculate Similarity ---
-    vectorizer = TfidfVectorizer(min_df=1, analyzer=ngrams, lowercase=False)
-    tfidf = vectorizer.fit_transform([user_skills_str] + list(jd_df['skills'].values.astype('U')))
-    
-    skills_tfidf = tfidf[0:1, :]
-    jd_tfidf = tfidf[1:, :]
-    
-    cosine_similarities = cosine_similarity(skills_tfidf, jd_tfidf)
-    
-    matches = pd.DataFrame(cosine_similarities.T, columns=['Match Confidence'])
-    jd_df['Match Confidence'] = matches['Match Confidence']
+    # --- 4. Rank Jobs ---
+    # Show jobs with ANY match confidence (even if very low)
+    # This ensures we always show at least 10-15 jobs
+    candidates = np.flatnonzero(match > 0)
 
-    # --- 5. Score and Rank Jobs ---
-    # Calculate scores for ALL jobs, not just those matching experience requirements
-    jd_df['Experience Score'] = jd_df['Required Experience'].apply(
-        lambda x: calculate_experience_score(x, user_work_experience)
-    )
+    # If still not enough jobs, show all jobs
+    if len(candidates) < 10:
+        print(f"Only {len(candidates)} jobs matched, showing all {len(match)} jobs")
+        candidates = np.arange(len(match))
 
-    # Calculate combined score for all jobs
-    jd_df['Combined Score'] = (jd_df['Match Confidence'] * CONFIDENCE_WEIGHT) + (jd_df['Experience Score'] * EXPERIENCE_WEIGHT)
-    
-    # Normalize the combined scores
-    min_score = jd_df['Combined Score'].min()
-    max_score = jd_df['Combined Score'].max()
-    if max_score > min_score:
-        jd_df['Combined Score'] = (jd_df['Combined Score'] - min_score) / (max_score - min_score)
+    # Select the top MAX_RECOMMENDATIONS with an O(N) partition, then sort only those
+    k = min(MAX_RECOMMENDATIONS, len(candidates))
+    if k:
+        top = candidates[np.argpartition(combined[candidates], -k)[-k:]]
+        top = top[np.argsort(combined[top])[::-1]]
     else:
-        jd_df['Combined Score'] = 0.5 # Handle case where all scores are the same
+        top = candidates
 
-    # --- 6. Finalize Recommendations ---
-    # Show jobs with ANY match confidence (even if very low)
-    # This ensures we always show at least 10-15 jobs
-    recommended_jobs = jd_df[jd_df['Match Confidence'] > 0].copy()
-    
-    # If still not enough jobs, show all jobs
-    if len(recommended_jobs) < 10:
-        print(f"Only {len(recommended_jobs)} jobs matched, showing all {len(jd_df)} jobs")
-        recommended_jobs = jd_df.copy()
+    # --- 5. Finalize Recommendations ---
+    # Only the selected rows are materialized as a DataFrame.
+    recommended_jobs = idx.df.iloc[top].copy()
+    recommended_jobs['Match Confidence'] = match[top]
+    recommended_jobs['Experience Score'] = (idx.required_exp[top] <= user_work_experience).astype(np.float32)
 
-    recommended_jobs['Strengths'] = recommended_jobs['skills'].apply(lambda x: find_strengths(x, user_skills_set))
-    recommended_jobs['Weakness'] = recommended_jobs['Title'].apply(lambda x: find_weaknesses(x, user_skills_set, job_skill_weights))
-    
-    recommended_jobs = recommended_jobs.sort_values(by='Combined Score', ascending=False)
+    # Normalize the combined scores against all jobs
+    score_range = np.ptp(combined) if combined.size else 0.0
+    if score_range > 0:
+        recommended_jobs['Combined Score'] = (combined[top] - combined.min()) / score_range
+    else:
+        recommended_jobs['Combined Score'] = 0.5 # Handle case where all scores are the same
 
-    # Ensure we return at least 10 jobs if available, maximum 25
-    min_jobs = min(10, len(recommended_jobs))
-    max_jobs = min(25, len(recommended_jobs))
-    
-    # Return at least 10 jobs, or all if less than 10 available
-    if len(recommended_jobs) >= min_jobs:
-        recommended_jobs = recommended_jobs.head(max_jobs)
+    # Only the selected rows need strengths/weaknesses; job skill sets are
+    # precomputed in the index (its RangeIndex labels are row positions).
+    recommended_jobs['Strengths'] = [find_strengths(idx.skills_sets[i], user_skills_set) for i in recommended_jobs.index]
+    recommended_jobs['Weakness'] = recommended_jobs['Title'].apply(lambda x: find_weaknesses(x, user_skills_set, role_table))
     
     print(f"Returning {len(recommended_jobs)} job recommendations")
 
-    # --- 7. Return Results ---
+    # --- 6. Return Results ---
     # The FastAPI app will handle saving to CSV if needed, or return directly
     return recommended_jobs
 
@@ -198,6 +355,9 @@ if __name__ == '__main__':
         def _extract_skills_from_text(self, text):
             # Simple mock for testing
             return set(text.lower().split())
+
+        def _extract_skills_batch(self, texts):
+            return (self._extract_skills_from_text(text) for text in texts)
     
     skills_extraction = MockSkillsExtraction()
 
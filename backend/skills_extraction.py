@@ -1,40 +1,166 @@
 import os
+import io
 import re
 import math
-import csv
-from datetime import datetime
-import spacy
-from spacy.matcher import Matcher
+import hashlib
+import pickle
+from datetime import date
+from functools import lru_cache
+try:
+    # PDFium (C++) text extraction; PyPDF2 is the pure-Python fallback
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 import PyPDF2
+from typing import Iterable, Iterator
 
 # --- Constants ---
 SKILLS_CSV_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'tech_skills_clean.csv')
+# Pickled automaton cache, reused across process starts while the CSV is unchanged
+MATCHER_CACHE_PATH = SKILLS_CSV_PATH + '.matcher.pkl'
+# Bump whenever automaton keys or payloads change so stale caches are rebuilt
+_MATCHER_FORMAT_VERSION = 2
+# Lowercased skills never reported even if present in the skills CSV
+_BANNED_SKILLS = frozenset({'computer'})
+_SKILLS_CSV_SPLIT_RE = re.compile(rb'[,\r\n]+')
+# Skill tokens: letters/digits with inner dots (node.js) and trailing + or # (c++, c#).
+# Everything else, including '/' and '-', separates tokens (ci/cd -> ci cd).
+_SKILL_TOKEN_RE = re.compile(r'[^\W_]+(?:\.[^\W_]+)*[+#]*')
+_EXPERIENCE_RE = re.compile(
+    r'\b(?P<m1>[A-Za-z]{3,9})\s+(?P<y1>\d{4})\s*[-to]+\s*'
+    r'(?:(?P<m2>[A-Za-z]{3,9})\s+(?P<y2>\d{4})|(?P<pres>Present))',
+    re.IGNORECASE,
+)
+# Cheap pre-check: text with no year-like token cannot contain a date range
+_YEAR_HINT = re.compile(r'(?:19|20)\d{2}')
+_MONTH_NAMES = ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+                'august', 'september', 'october', 'november', 'december')
+# Full and abbreviated month names -> month number
+_MONTHS = {name: i for i, name in enumerate(_MONTH_NAMES, start=1)}
+_MONTHS.update({name[:3]: i for i, name in enumerate(_MONTH_NAMES, start=1)})
+_MONTHS['sept'] = 9
 
 # --- Globals for Lazy Loading ---
 nlp = None
 matcher = None
+# Aho-Corasick automaton over lowercased skills; preferred over the spaCy
+# matcher, which is only loaded when pyahocorasick is unavailable.
+automaton = None
 
 # Flag set when spaCy is unavailable
 SPACY_AVAILABLE = True
 
 # --- Initialization ---
 
+def _load_skills(data: bytes) -> list[str]:
+    """Parses the unique skills from the CSV bytes, flattening rows and columns, in sorted order."""
+    # The file is a flat, unquoted vocabulary, so one bytes split replaces csv row/cell iteration
+    skills = {cell.strip() for cell in _SKILLS_CSV_SPLIT_RE.split(data)}
+    skills.discard(b'')
+    return sorted(cell.decode('utf-8') for cell in skills)
+
+def _skill_tokens(text: str) -> list[str]:
+    """Lowercased skill tokens; shared by both matchers for skills and searched text."""
+    return _SKILL_TOKEN_RE.findall(text.lower())
+
+def _skill_keys(skills: list[str]) -> dict[str, str]:
+    """Maps each skill's space-joined token key to the skill (first one wins)."""
+    keys = {}
+    for skill in skills:
+        key = ' '.join(_skill_tokens(skill))
+        if key:
+            keys.setdefault(key, skill)
+    return keys
+
+def _build_automaton(skills: list[str]):
+    """
+    Builds an Aho-Corasick automaton keyed on each skill's token key, so a
+    single linear scan of the tokenized text finds every skill occurrence.
+    Raises ImportError if pyahocorasick is not installed.
+    """
+    import ahocorasick
+    auto = ahocorasick.Automaton()
+    for key, skill in _skill_keys(skills).items():
+        auto.add_word(key, (len(key), skill))
+    if len(auto):
+        auto.make_automaton()
+    return auto
+
+def _matcher_cache_key(data: bytes) -> tuple[int, str]:
+    """Identifies an automaton by the build format and the MD5 of the CSV it was built from."""
+    return _MATCHER_FORMAT_VERSION, hashlib.md5(data).hexdigest()
+
+def _load_cached_automaton(cache_key: tuple[int, str]):
+    """Returns the pickled automaton if it was built with this cache key."""
+    try:
+        with open(MATCHER_CACHE_PATH, 'rb') as f:
+            cached_key, auto = pickle.load(f)
+    except Exception:
+        # Missing, corrupt, or pyahocorasick not installed
+        return None
+    return auto if cached_key == cache_key else None
+
+def _save_cached_automaton(cache_key: tuple[int, str], auto) -> None:
+    try:
+        tmp_path = MATCHER_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((cache_key, auto), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, MATCHER_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: could not write matcher cache to {MATCHER_CACHE_PATH}: {e}")
+
+class _SkillTokenizer:
+    """spaCy tokenizer producing the same tokens as the automaton path."""
+    def __init__(self, vocab):
+        self.vocab = vocab
+
+    def __call__(self, text: str):
+        return Doc(self.vocab, words=_skill_tokens(text))
+
 def initialize_matcher():
     """
-    Loads the spacy model and skills matcher on first use.
-    This avoids loading them on module import.
+    Loads the skills matcher on first use.
+    This avoids loading it on module import.
     """
-    global nlp, matcher, spacy, Matcher, SPACY_AVAILABLE
-    if nlp is not None or not SPACY_AVAILABLE:
+    global nlp, matcher, automaton, spacy, PhraseMatcher, Doc, SPACY_AVAILABLE
+    if automaton is not None or nlp is not None or not SPACY_AVAILABLE:
         return  # Already initialized or previously disabled
 
+    # Read the CSV once: the same bytes are hashed for the cache key and parsed
+    try:
+        with open(SKILLS_CSV_PATH, 'rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        print(f"Warning: Skill file not found at {SKILLS_CSV_PATH}. Skill matching will be disabled.")
+        data = None
+
+    cache_key = _matcher_cache_key(data) if data is not None else None
+    if cache_key is not None:
+        cached = _load_cached_automaton(cache_key)
+        if cached is not None:
+            automaton = cached
+            print(f"Loaded {len(automaton)} skills from matcher cache {MATCHER_CACHE_PATH}.")
+            return
+
+    skills = _load_skills(data) if data is not None else []
+
+    try:
+        automaton = _build_automaton(skills)
+        print(f"Loaded {len(automaton)} skills into the Aho-Corasick matcher from {SKILLS_CSV_PATH}.")
+        if cache_key is not None:
+            _save_cached_automaton(cache_key, automaton)
+        return
+    except ImportError:
+        print("pyahocorasick not available: falling back to the spaCy matcher.")
+
     print("Attempting to load spaCy model and skills matcher...")
     try:
         # Lazy import so the rest of the app can run without spaCy installed
         import importlib
         spacy = importlib.import_module('spacy')
         spacy_matcher = importlib.import_module('spacy.matcher')
-        Matcher = getattr(spacy_matcher, 'Matcher')
+        PhraseMatcher = getattr(spacy_matcher, 'PhraseMatcher')
+        Doc = getattr(importlib.import_module('spacy.tokens'), 'Doc')
     except Exception:
         # If spaCy isn't available, note it and disable matcher functionality.
         SPACY_AVAILABLE = False
@@ -42,67 +168,67 @@ def initialize_matcher():
         return
 
     try:
-        nlp = spacy.load('en_core_web_sm')
+        # The matcher only matches on LOWER, so only the tokenizer and vocab are
+        # needed; skip loading every trained pipeline component.
+        nlp = spacy.load(
+            'en_core_web_sm',
+            exclude=['tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner', 'senter'],
+        )
     except OSError:
         print("Error: 'en_core_web_sm' model not found. Skill matching will be disabled.")
         SPACY_AVAILABLE = False
         return
+    # Tokenize exactly like the automaton so both backends find the same skills
+    nlp.tokenizer = _SkillTokenizer(nlp.vocab)
 
-    matcher = Matcher(nlp.vocab)
+    # PhraseMatcher matches all phrases in one trie walk per doc instead of
+    # testing every token pattern.
+    matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
     
-    try:
-        # Read all skills from the CSV, flatten rows and columns
-        skills = []
-        with open(SKILLS_CSV_PATH, 'r', newline='') as file:
-            csv_reader = csv.reader(file)
-            for row in csv_reader:
-                for cell in row:
-                    cell = cell.strip()
-                    if cell:
-                        skills.append(cell)
-
-        # Build token-based patterns that tolerate punctuation and multi-word skills.
-        def _normalize_skill_text(s: str) -> str:
-            # Replace common punctuation used in skill names with spaces so tokens match
-            return re.sub(r'[\.#\+\-/]', ' ', s).strip()
-
-        patterns_added = 0
-        for skill in skills:
-            norm = _normalize_skill_text(skill)
-            tokens = [t for t in norm.split() if t]
-            if not tokens:
-                continue
-            pattern = [{'LOWER': t.lower()} for t in tokens]
-            try:
-                # Use skill text as the matcher ID so we can see what matched
-                matcher.add(skill, [pattern])
-                patterns_added += 1
-            except Exception:
-                # Some matcher implementations require unique ids; ignore duplicates
-                try:
-                    matcher.add('SKILL', [pattern])
-                    patterns_added += 1
-                except Exception:
-                    continue
+    if skills:
+        # One label per skill, so a match maps back to the CSV skill like the automaton payload
+        skill_keys = _skill_keys(skills)
+        for key, skill in skill_keys.items():
+            matcher.add(skill, [nlp.make_doc(key)])
+        patterns_added = len(skill_keys)
 
         if patterns_added == 0:
             print(f"Warning: No skill patterns were added from {SKILLS_CSV_PATH}. Skill matching will be limited.")
         else:
             print(f"Loaded {patterns_added} skill patterns from {SKILLS_CSV_PATH}.")
-    except FileNotFoundError:
-        print(f"Warning: Skill file not found at {SKILLS_CSV_PATH}. Skill matching will be disabled.")
     
     print("Initialization complete.")
 
 # --- Core Functions ---
 
+def _read_pdf_text(data: bytes) -> str:
+    """Extracts text from PDF bytes."""
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(data)
+        try:
+            return '\n'.join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    parts = []
+    for page in pdf_reader.pages:
+        # extract_text() is the expensive part, so call it once per page
+        page_text = page.extract_text()
+        if page_text:
+            parts.append(page_text)
+    return '\n'.join(parts)
+
+@lru_cache(maxsize=64)
+def _read_pdf_file_cached(file_path: str, mtime: float) -> str:
+    # mtime is part of the key so an edited file is re-read; errors are not cached
+    with open(file_path, 'rb') as f:
+        return _read_pdf_text(f.read())
+
 def extract_text_from_pdf(file_path: str) -> str:
     """Extracts text from a PDF file."""
     try:
-        with open(file_path, 'rb') as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            text = ''.join(page.extract_text() for page in pdf_reader.pages if page.extract_text())
-        return text
+        return _read_pdf_file_cached(file_path, os.path.getmtime(file_path))
     except FileNotFoundError:
         print(f"Error: Resume file not found at {file_path}")
         return ""
@@ -110,51 +236,99 @@ def extract_text_from_pdf(file_path: str) -> str:
         print(f"Error reading PDF file: {e}")
         return ""
 
+def extract_text_from_pdf_bytes(data: bytes) -> str:
+    """Extracts text from an in-memory PDF."""
+    try:
+        return _read_pdf_text(data)
+    except Exception as e:
+        print(f"Error reading PDF file: {e}")
+        return ""
+
+def _accept_skills(matched: set[str]) -> set[str]:
+    """Drops numeric and banned skills and title-cases the rest, once per distinct match."""
+    skills = set()
+    for skill in matched:
+        key = skill.lower()
+        if key in _BANNED_SKILLS or key.isdigit():
+            continue
+        skills.add(skill.title())
+    return skills
+
+def _match_automaton(text: str) -> set[str]:
+    """Finds whole-token skill occurrences with one Aho-Corasick scan of the text."""
+    if not len(automaton):
+        return set()
+
+    haystack = ' '.join(_skill_tokens(text))
+    n = len(haystack)
+    matched = set()
+    for end, (length, skill) in automaton.iter(haystack):
+        start = end - length + 1
+        # Only accept matches spanning whole tokens (not 'java' in 'javascript' or 'c' in 'c++')
+        if (start > 0 and haystack[start - 1] != ' ') or (end + 1 < n and haystack[end + 1] != ' '):
+            continue
+        matched.add(skill)
+
+    return _accept_skills(matched)
+
 def _extract_skills_from_text(text: str) -> set[str]:
-    """Extracts skills from text using the spaCy matcher."""
+    """Extracts skills from text using the Aho-Corasick automaton, or the spaCy matcher as a fallback."""
     initialize_matcher()
-    if not text or nlp is None:
+    if not text:
+        return set()
+    if automaton is not None:
+        return _match_automaton(text)
+    if nlp is None:
         return set()
 
-    doc = nlp(text)
-    matches = matcher(doc)
-    
-    skills = set()
-    for _, start, end in matches:
-        skill = doc[start:end].text
-        if not skill.isnumeric() and skill.lower() != 'computer':
-            skills.add(skill.title())
-            
-    return skills
+    return _match_doc(nlp.make_doc(text))  # tokenize only, bypassing the pipeline
+
+def _match_doc(doc) -> set[str]:
+    """Collects skills from a spaCy doc using the phrase matcher."""
+    return _accept_skills({nlp.vocab.strings[match_id] for match_id, _, _ in matcher(doc)})
+
+def _extract_skills_batch(texts: Iterable[str], batch_size: int = 64, n_process: int = 1) -> Iterator[set[str]]:
+    """
+    Extracts skills from many texts, yielding one set per text in order.
+    The spaCy fallback tokenizes through nlp.pipe in batches (optionally
+    across n_process worker processes) instead of paying per-call overhead.
+    """
+    initialize_matcher()
+    if automaton is not None:
+        for text in texts:
+            yield _match_automaton(text) if text else set()
+        return
+    if nlp is None:
+        for _ in texts:
+            yield set()
+        return
+
+    for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+        yield _match_doc(doc)
 
 def _extract_work_experience_from_text(text: str) -> int:
     """Calculates total years of work experience from text."""
-    
-    def parse_date(date_str: str):
-        """Helper to parse various date formats."""
-        for fmt in ("%B %Y", "%b %Y"):  # Full and abbreviated month
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except ValueError:
-                continue
-        return None
+    if not _YEAR_HINT.search(text):
+        return 10 # Same default as when no ranges are found
 
-    total_years = 0
-    pattern = re.compile(r'(\w+\s\d{4})\s*[-to]+\s*(\w+\s\d{4}|Present)', re.IGNORECASE)
-    matches = pattern.findall(text)
-    
-    for start_date_str, end_date_str in matches:
-        start_date = parse_date(start_date_str)
-        
-        if end_date_str.lower() == 'present':
-            end_date = datetime.now()
+    today = date.today()
+    total_months = 0
+    for m in _EXPERIENCE_RE.finditer(text):
+        start_month = _MONTHS.get(m.group('m1').lower())
+        if start_month is None:
+            continue
+
+        if m.group('pres'):
+            end_year, end_month = today.year, today.month
         else:
-            end_date = parse_date(end_date_str)
-            
-        if start_date and end_date:
-            years = (end_date - start_date).days / 365.25
-            total_years += years
-            
+            end_month = _MONTHS.get(m.group('m2').lower())
+            if end_month is None:
+                continue
+            end_year = int(m.group('y2'))
+
+        total_months += (end_year - int(m.group('y1'))) * 12 + (end_month - start_month)
+
+    total_years = total_months / 12
     return math.ceil(total_years) if total_years > 0 else 10 # Return default 10 if 0
 
 # --- Public Functions (to be called from other modules) ---
@@ -164,7 +338,16 @@ def process_resume_from_path(file_path: str) -> tuple[list[str], int]:
     Processes a resume file to extract skills and work experience.
     Returns a tuple of (skills_list, experience_years).
     """
-    resume_text = extract_text_from_pdf(file_path)
+    return _process_resume_text(extract_text_from_pdf(file_path))
+
+def process_resume_from_bytes(data: bytes) -> tuple[list[str], int]:
+    """
+    Processes an in-memory resume PDF (e.g. an upload) to extract skills and work experience.
+    Returns a tuple of (skills_list, experience_years).
+    """
+    return _process_resume_text(extract_text_from_pdf_bytes(data))
+
+def _process_resume_text(resume_text: str) -> tuple[list[str], int]:
     skills_set = _extract_skills_from_text(resume_text)
     experience = _extract_work_experience_from_text(resume_text)
     
@@ -176,7 +359,7 @@ def skills_extractor(file_path: str, convert_to_string: bool = False):
     High-level function to extract skills from a resume file.
     Maintained for compatibility with job_recommendor.py
     """
-    skills_list, _ = process_resume_from_path(file_path)
+    skills_list = sorted(_extract_skills_from_text(extract_text_from_pdf(file_path)))
     if convert_to_string:
         return ' '.join(skills_list)
     return skills_list
@@ -186,5 +369,5 @@ def workd_exp_extractor(file_path: str) -> int:
     High-level function to extract work experience from a resume file.
     Maintained for compatibility with job_recommendor.py
     """
-    _, experience = process_resume_from_path(file_path)
-    return experience
+    # Experience parsing is regex-only, so this never loads the skills matcher
+    return _extract_work_experience_from_text(extract_text_from_pdf(file_path))
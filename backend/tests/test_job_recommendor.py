@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+import job_recommendor as jr
+
+WEIGHTS = {
+    'Engineer': {'Python': 0.8, 'Git': 0.6, 'Linux': 0.4},
+    'Data Engineer': {'Python': 0.9, 'Spark': 0.7, 'Sql': 0.5, 'Airflow': 0.3},
+    'Data': {'Excel': 0.9},
+}
+
+
+def test_role_table_prefers_longest_role():
+    table = jr._build_role_table(WEIGHTS)
+    # 'data engineer' must win over both 'data' and 'engineer'
+    assert jr.find_weaknesses('Senior Data Engineer', set(), table) == 'Python Spark Sql'
+
+
+def test_find_weaknesses_ranks_by_weight_and_skips_known_skills():
+    table = jr._build_role_table(WEIGHTS)
+    assert jr.find_weaknesses('data engineer (remote)', {'Python', 'Sql'}, table) == 'Spark Airflow'
+
+
+def test_find_weaknesses_defaults_to_engineer():
+    table = jr._build_role_table(WEIGHTS)
+    assert jr.find_weaknesses('Product Designer', {'Git'}, table) == 'Python Linux'
+
+
+def test_empty_role_table_matches_nothing():
+    table = jr._build_role_table({})
+    assert table.pattern.search('') is None
+    assert jr.find_weaknesses('Data Engineer', set(), table) == ''
+
+
+def _index(job_skills, required_exp):
+    jd = jr.VECTORIZER.transform(job_skills).tocsr()
+    jd.sort_indices()
+    return SimpleNamespace(jd_tfidf=jd, required_exp=np.asarray(required_exp, dtype=np.float32))
+
+
+def test_score_kernel_matches_linear_kernel_fallback(monkeypatch):
+    idx = _index(
+        ['Python Sql Docker', 'Java Spring', '', 'Python Machine Learning Pandas', 'Sql'],
+        [2, 5, 0, np.inf, 1],
+    )
+    user = jr.VECTORIZER.transform(['Docker Pandas Python Sql'])
+
+    sims, combined = jr._score_jobs(user.copy(), idx, 3)
+    monkeypatch.setattr(jr, 'njit', None)
+    fb_sims, fb_combined = jr._score_jobs(user.copy(), idx, 3)
+
+    assert sims.dtype == fb_sims.dtype == np.float32
+    np.testing.assert_allclose(sims, fb_sims, rtol=1e-6, atol=1e-7)
+    np.testing.assert_allclose(combined, fb_combined, rtol=1e-6, atol=1e-7)
+    # Experience only adds EXPERIENCE_WEIGHT where the requirement is met
+    np.testing.assert_allclose(combined - sims * jr.CONFIDENCE_WEIGHT,
+                               [jr.EXPERIENCE_WEIGHT, 0, jr.EXPERIENCE_WEIGHT, 0, jr.EXPERIENCE_WEIGHT],
+                               atol=1e-6)
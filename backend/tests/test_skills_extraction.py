@@ -0,0 +1,66 @@
+import pytest
+
+import skills_extraction as se
+
+SAMPLE = (
+    'Built CI/CD pipelines with Node.js and Python on AWS; C++, C# and Java. '
+    'Machine   learning with react-redux. Not: javascripting, computer, cpp.'
+)
+EXPECTED = {'Aws', 'C#', 'C++', 'Ci/Cd', 'Java', 'Machine Learning', 'Node.Js', 'Python', 'React', 'Redux'}
+
+
+@pytest.fixture
+def fresh_matcher(monkeypatch, tmp_path):
+    """Resets the lazily built matcher and keeps its pickle cache out of the repo."""
+    monkeypatch.setattr(se, 'MATCHER_CACHE_PATH', str(tmp_path / 'matcher.pkl'))
+    for name in ('nlp', 'matcher', 'automaton'):
+        monkeypatch.setattr(se, name, None)
+    monkeypatch.setattr(se, 'SPACY_AVAILABLE', True)
+
+
+def _use_spacy_fallback(monkeypatch):
+    spacy = pytest.importorskip('spacy')
+
+    def no_automaton(skills):
+        raise ImportError
+
+    monkeypatch.setattr(se, '_build_automaton', no_automaton)
+    # Only the tokenizer and vocab are used, so a blank pipeline stands in for en_core_web_sm
+    monkeypatch.setattr(spacy, 'load', lambda *args, **kwargs: spacy.blank('en'))
+
+
+def test_skill_tokens_keep_skill_punctuation():
+    assert se._skill_tokens('C++, C#; Node.js. CI/CD') == ['c++', 'c#', 'node.js', 'ci', 'cd']
+
+
+def test_automaton_matches_whole_tokens_only(fresh_matcher):
+    pytest.importorskip('ahocorasick')
+    assert se._extract_skills_from_text(SAMPLE) == EXPECTED
+
+
+def test_spacy_fallback_matches_automaton(fresh_matcher, monkeypatch):
+    _use_spacy_fallback(monkeypatch)
+    assert se._extract_skills_from_text(SAMPLE) == EXPECTED
+    assert list(se._extract_skills_batch([SAMPLE, ''])) == [EXPECTED, set()]
+
+
+@pytest.mark.parametrize('text, years', [
+    ('Engineer, Jan 2018 - Mar 2020', 3),                                # 26 months
+    ('Jan 2018 - Jan 2019; June 2019 to Sept 2020', 3),                  # 12 + 15 months
+    ('JANUARY 2020 to december 2020', 1),                                # 11 months
+    ('Foo 2018 - Mar 2020', 10),                                         # unknown month is skipped
+    ('Graduated in 2019', 10),                                           # year but no range
+    ('Python, SQL and Docker', 10),                                      # no year at all
+])
+def test_work_experience_sums_month_spans(text, years):
+    assert se._extract_work_experience_from_text(text) == years
+
+
+def test_work_experience_present_uses_today(monkeypatch):
+    class FixedDate(se.date):
+        @classmethod
+        def today(cls):
+            return cls(2024, 7, 15)
+
+    monkeypatch.setattr(se, 'date', FixedDate)
+    assert se._extract_work_experience_from_text('Jan 2023 - Present') == 2  # 18 months
@@ -5,18 +5,26 @@ data/job_data.csv. Exposes fetch_and_update_jobs() which returns the
 number of newly added jobs.
 """
 
+import asyncio
 import os
 from typing import List, Dict
 
+import aiohttp
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
+
+# Listing pages to scrape; they are fetched concurrently so adding pages or
+# boards costs roughly the latency of the slowest request, not their sum
+JOB_LIST_URLS = [
+    'https://jobs.python.org/',
+]
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
 
 
 def _parse_job_element(li) -> Dict[str, str]:
     """Parse a single <li> job element into the expected job dict."""
     # Title and link
-    a = li.find('a')
+    a = li.select_one('a')
     if not a or not a.get('href'):
         return {}
 
@@ -26,24 +34,20 @@ def _parse_job_element(li) -> Dict[str, str]:
         link = f"https://jobs.python.org{link}"
 
     # Company
-    company = ''
-    comp_span = li.find('span', class_='listing-company-name')
-    if comp_span:
-        company = comp_span.get_text(separator=' ', strip=True)
+    comp_span = li.select_one('span.listing-company-name')
+    company = comp_span.get_text(separator=' ', strip=True) if comp_span else ''
 
     # Location
-    location_el = li.find('span', class_='listing-location')
+    location_el = li.select_one('span.listing-location')
     location = location_el.get_text(strip=True) if location_el else ''
 
     # Job type
-    job_type_el = li.find('span', class_='listing-job-type')
+    job_type_el = li.select_one('span.listing-job-type')
     job_type = job_type_el.get_text(strip=True) if job_type_el else ''
 
     # Posted date
-    posted = ''
-    posted_el = li.find('span', class_='listing-posted')
-    if posted_el and posted_el.find('time'):
-        posted = posted_el.find('time').get_text(strip=True)
+    posted_el = li.select_one('span.listing-posted time')
+    posted = posted_el.get_text(strip=True) if posted_el else ''
 
     return {
         'Title': title,
@@ -63,8 +67,44 @@ def _parse_job_element(li) -> Dict[str, str]:
     }
 
 
+def _parse_job_page(content: bytes) -> List[Dict[str, str]]:
+    """Parse a job listing page into a list of job dicts."""
+    try:
+        soup = BeautifulSoup(content, 'lxml')
+    except FeatureNotFound:
+        # lxml not installed: fall back to the stdlib parser
+        soup = BeautifulSoup(content, 'html.parser')
+    container = soup.select_one('ol.list-recent-jobs')
+    if not container:
+        print('Job list container not found on the page')
+        return []
+
+    return [parsed for parsed in map(_parse_job_element, container.select('li')) if parsed]
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str) -> bytes:
+    async with session.get(url) as resp:
+        resp.raise_for_status()
+        return await resp.read()
+
+
+async def _scrape_pages(urls: List[str]) -> List[List[Dict[str, str]]]:
+    """Fetch all listing pages concurrently and parse them off the event loop."""
+    async with aiohttp.ClientSession(timeout=REQUEST_TIMEOUT) as session:
+        pages = await asyncio.gather(*[_fetch(session, u) for u in urls], return_exceptions=True)
+
+    loop = asyncio.get_running_loop()
+    parse_tasks = []
+    for url, page in zip(urls, pages):
+        if isinstance(page, Exception):
+            print(f'Error fetching jobs from {url}: {page}')
+            continue
+        parse_tasks.append(loop.run_in_executor(None, _parse_job_page, page))
+    return await asyncio.gather(*parse_tasks)
+
+
 def fetch_and_update_jobs() -> int:
-    """Scrape jobs.python.org and update data/job_data.csv.
+    """Scrape the JOB_LIST_URLS pages and update data/job_data.csv.
 
     Returns the number of newly added jobs.
     """
@@ -72,42 +112,29 @@ def fetch_and_update_jobs() -> int:
     data_dir = os.path.join(repo_root, 'data')
     job_data_path = os.path.join(data_dir, 'job_data.csv')
 
+    # Only the Link column is needed to diff against the current job list
     try:
-        existing_df = pd.read_csv(job_data_path)
-    except FileNotFoundError:
-        existing_df = pd.DataFrame()
+        existing_links = set(pd.read_csv(job_data_path, usecols=['Link'])['Link'].dropna())
+    except (FileNotFoundError, ValueError):
+        existing_links = set()
 
-    url = 'https://jobs.python.org/'
-    try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-    except Exception as e:
-        print(f'Error fetching jobs: {e}')
-        return 0
-
-    soup = BeautifulSoup(resp.content, 'html.parser')
-    container = soup.find('ol', class_='list-recent-jobs')
-    if not container:
-        print('Job list container not found on the page')
-        return 0
+    # Called from a worker thread, so there is no running event loop here
+    parsed_pages = asyncio.run(_scrape_pages(JOB_LIST_URLS))
 
+    # Deduplicate the newly scraped jobs by Link across all pages
     jobs: List[Dict[str, str]] = []
-    for li in container.find_all('li'):
-        parsed = _parse_job_element(li)
-        if parsed:
-            jobs.append(parsed)
+    seen_links = set()
+    for page_jobs in parsed_pages:
+        for parsed in page_jobs:
+            if parsed['Link'] not in seen_links:
+                seen_links.add(parsed['Link'])
+                jobs.append(parsed)
 
     if not jobs:
         print('No jobs scraped')
         return 0
 
     new_df = pd.DataFrame(jobs)
-    
-    # Deduplicate the newly scraped jobs by Link
-    new_df = new_df.drop_duplicates(subset=['Link'], keep='first')
-    
-    # Calculate the difference: how many jobs changed
-    old_count = len(existing_df) if not existing_df.empty else 0
     new_count = len(new_df)
     
     # REPLACE the entire job list with fresh data from the website
@@ -115,8 +142,9 @@ def fetch_and_update_jobs() -> int:
     os.makedirs(data_dir, exist_ok=True)
     new_df.to_csv(job_data_path, index=False)
 
-    jobs_added = max(0, new_count - old_count)
-    jobs_removed = max(0, old_count - new_count)
+    # Calculate the difference: which jobs changed
+    jobs_added = len(seen_links - existing_links)
+    jobs_removed = len(existing_links - seen_links)
     
     if jobs_added > 0 and jobs_removed > 0:
         print(f'Updated job list: +{jobs_added} new, -{jobs_removed} removed, total: {new_count}')
@@ -482,8 +482,23 @@ const Index = () => {
         return; // Exit early
       }
       
-      const data = await res.json();
-      setSuggestions(data.suggestions || "");
+      // Suggestions are streamed as plain text; render them as chunks arrive
+      let text = "";
+      setSuggestions("");
+      if (res.body) {
+        const reader = res.body.getReader();
+        const decoder = new TextDecoder();
+        while (true) {
+          const { done, value } = await reader.read();
+          if (done) break;
+          text += decoder.decode(value, { stream: true });
+          setSuggestions(text);
+        }
+        text += decoder.decode();
+      } else {
+        text = await res.text();
+      }
+      setSuggestions(text);
       
       toast({ 
         title: "Success!", 